@@ -1,4 +1,5 @@
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated
 
@@ -28,6 +29,10 @@ class PyPIPublisher(_PyPIPublisher):
         self.ctx.run(cmd)
 
 
+_PYPI_REGISTRIES = frozenset(PyPIPublisher.valid_registries)
+_CRATES_REGISTRIES = frozenset(CratesPublisher.valid_registries)
+
+
 class MyBakebook(RustSpace, PythonSpace, BaseLibSpace):
     zerv_test_native_git: bool = False
     zerv_test_docker: bool = True
@@ -35,15 +40,15 @@ class MyBakebook(RustSpace, PythonSpace, BaseLibSpace):
     _target: str | None = None
 
     def get_publish_registries(self) -> set[str]:
-        return set(PyPIPublisher.valid_registries) | set(CratesPublisher.valid_registries)
+        return set(_PYPI_REGISTRIES | _CRATES_REGISTRIES)
 
     def get_publisher(self, registry: str) -> PyPIPublisher | CratesPublisher:
         """Return the appropriate publisher, using custom PyPIPublisher for maturin builds."""
-        if registry in PyPIPublisher.valid_registries:
+        if registry in _PYPI_REGISTRIES:
             publisher = PyPIPublisher(self.ctx, registry)
             publisher._target = self._target
             return publisher
-        if registry in CratesPublisher.valid_registries:
+        if registry in _CRATES_REGISTRIES:
             return CratesPublisher(self.ctx, registry)
 
         valid = (*PyPIPublisher.valid_registries, *CratesPublisher.valid_registries)
@@ -81,6 +86,7 @@ class MyBakebook(RustSpace, PythonSpace, BaseLibSpace):
             "--features test-utils "
             "--out Xml --out Html --out Lcov "
             "--output-dir coverage "
+            "--target-dir target/tarpaulin "
             "--include-tests "
             "--exclude-files 'src/main.rs' "
             "--exclude-files '**/tests/**' "
@@ -98,9 +104,7 @@ class MyBakebook(RustSpace, PythonSpace, BaseLibSpace):
         ] = False,
     ):
         if build:
-            self.ctx.run("maturin develop")
-            if not self.ctx.dry_run:
-                symlink_zerv_to_venv_bin()
+            self._build_python()
         tests_path = "tests/python"
         coverage_path = "python/zerv"
         self._test(tests_paths=tests_path, coverage_path=coverage_path)
@@ -118,8 +122,19 @@ class MyBakebook(RustSpace, PythonSpace, BaseLibSpace):
             zerv_force_rust_log_off=zerv_force_rust_log_off,
         )
 
-        self.test_rust()
-        self.test_python(build=True)
+        # Only the Python tests need `maturin develop`, so build it while the Rust tests run
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            rust_tests = executor.submit(self.test_rust)
+            python_build = executor.submit(self._build_python)
+            rust_tests.result()
+            python_build.result()
+
+        self.test_python()
+
+    def _build_python(self) -> None:
+        self.ctx.run("maturin develop")
+        if not self.ctx.dry_run:
+            symlink_zerv_to_venv_bin()
 
     @command()
     def gen_docs(self):
@@ -177,9 +192,7 @@ class MyBakebook(RustSpace, PythonSpace, BaseLibSpace):
     def _pre_publish_setup(self) -> None:
         """Custom pre-publish setup for zerv - handles both Rust and Python."""
         # zerv uses itself for versioning in _version_bump_context, so build and symlink it first
-        self.ctx.run("maturin develop")
-        if not self.ctx.dry_run:
-            symlink_zerv_to_venv_bin()
+        self._build_python()
 
         # Call BOTH publishers' setup (zerv is multi-lang)
         CratesPublisher._pre_publish_setup(self.ctx)  # removes target/package
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import subprocess
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _version
 from typing import Any, Literal
 
 from zerv._find_zerv import find_zerv_bin
+from zerv._spawn import HAS_POSIX_SPAWN, spawn_capture
+from zerv._worker import discard_worker, get_worker
 
 
 def _get_version() -> str:
@@ -16,7 +19,7 @@ def _get_version() -> str:
 
 
 __version__ = _get_version()
-__all__ = ["check", "find_zerv_bin", "flow", "render", "version"]
+__all__ = ["check", "find_zerv_bin", "flow", "render", "version", "version_many"]
 
 InputFormat = Literal["auto", "semver", "pep440"]
 OutputFormat = Literal["semver", "pep440", "zerv"]
@@ -88,18 +91,160 @@ def _extend_args(args: list[str], flags: list[tuple[str, Any]]) -> list[str]:
     return args
 
 
+@lru_cache(maxsize=1)
+def _zerv_bin() -> str:
+    # Resolved once per process; the lookup stats several candidate paths
+    return find_zerv_bin()
+
+
 def _run_zerv_command(args: list[str], stdin: str | None = None) -> str:
-    zerv_bin = find_zerv_bin()
-    result = subprocess.run(
-        [zerv_bin, *args],
-        input=stdin,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"zerv command failed: {result.stderr}")
-    return result.stdout.strip()
+    # zerv only sees `stdin`, never the caller's own stdin, however the command is run
+    zerv_bin = _zerv_bin()
+    worker = get_worker(zerv_bin)
+    if worker is not None:
+        response = worker.run(args, stdin)
+        if response is not None:
+            return _response_stdout(response)
+        # The worker exited mid-request or the binary predates `zerv serve`
+        discard_worker(worker)
+
+    return _run_zerv_process(zerv_bin, args, stdin)
+
+
+def _run_zerv_batch(requests: list[tuple[list[str], str | None]]) -> list[str]:
+    worker = get_worker(_zerv_bin())
+    if worker is not None:
+        responses = worker.run_many(requests)
+        if responses is not None:
+            return [_response_stdout(response) for response in responses]
+        discard_worker(worker)
+
+    return [_run_zerv_command(args, stdin) for args, stdin in requests]
+
+
+def _response_stdout(response: dict[str, Any]) -> str:
+    if response["code"] != 0:
+        raise RuntimeError(f"zerv command failed: {response['stderr']}")
+    return response["stdout"].strip()
+
+
+def _run_zerv_process(zerv_bin: str, args: list[str], stdin: str | None) -> str:
+    # Output stays as bytes; stderr is only decoded when the command fails
+    if stdin is None and HAS_POSIX_SPAWN:
+        returncode, stdout, stderr = spawn_capture([zerv_bin, *args])
+    else:
+        result = subprocess.run(
+            [zerv_bin, *args],
+            input=b"" if stdin is None else stdin.encode(),
+            capture_output=True,
+            check=False,
+        )
+        returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+
+    if returncode != 0:
+        raise RuntimeError(f"zerv command failed: {stderr.decode(errors='replace')}")
+    return stdout.decode().strip()
+
+
+_VERSION_FLAGS: dict[str, str] = {
+    # Input options
+    "source": "-s",
+    "input_format": "-f",
+    "repo_path": "-C",
+    # Output options
+    "output_format": "--output-format",
+    "output_template": "--output-template",
+    "output_prefix": "--output-prefix",
+    # Schema options
+    "schema": "--schema",
+    "schema_ron": "--schema-ron",
+    # VCS override options
+    "tag_version": "--tag-version",
+    "distance": "--distance",
+    "dirty": "--dirty",
+    "no_dirty": "--no-dirty",
+    "clean": "--clean",
+    "bumped_branch": "--bumped-branch",
+    "bumped_commit_hash": "--bumped-commit-hash",
+    "bumped_timestamp": "--bumped-timestamp",
+    # Version component override options
+    "major": "--major",
+    "minor": "--minor",
+    "patch": "--patch",
+    "epoch": "--epoch",
+    "post": "--post",
+    # Version-specific override options
+    "dev": "--dev",
+    "pre_release_label": "--pre-release-label",
+    "pre_release_num": "--pre-release-num",
+    "custom": "--custom",
+    # Schema component override options
+    "core": "--core",
+    "extra_core": "--extra-core",
+    "build": "--build",
+    # Field-based bump options
+    "bump_major": "--bump-major",
+    "bump_minor": "--bump-minor",
+    "bump_patch": "--bump-patch",
+    "bump_post": "--bump-post",
+    "bump_dev": "--bump-dev",
+    "bump_pre_release_num": "--bump-pre-release-num",
+    "bump_epoch": "--bump-epoch",
+    "bump_pre_release_label": "--bump-pre-release-label",
+    # Schema-based bump options
+    "bump_core": "--bump-core",
+    "bump_extra_core": "--bump-extra-core",
+    "bump_build": "--bump-build",
+    # Context control options
+    "bump_context": "--bump-context",
+    "no_bump_context": "--no-bump-context",
+}
+
+
+_FLOW_FLAGS: dict[str, str] = {
+    "repo_path": "-C",
+    "source": "-s",
+    "verbose": "-v",
+    "input_format": "-f",
+    "output_format": "--output-format",
+    "output_template": "--output-template",
+    "output_prefix": "--output-prefix",
+    "pre_release_label": "--pre-release-label",
+    "pre_release_num": "--pre-release-num",
+    "post_mode": "--post-mode",
+    "branch_rules": "--branch-rules",
+    "tag_version": "--tag-version",
+    "distance": "--distance",
+    "dirty": "--dirty",
+    "no_dirty": "--no-dirty",
+    "clean": "--clean",
+    "bumped_branch": "--bumped-branch",
+    "bumped_commit_hash": "--bumped-commit-hash",
+    "bumped_timestamp": "--bumped-timestamp",
+    "major": "--major",
+    "minor": "--minor",
+    "patch": "--patch",
+    "epoch": "--epoch",
+    "post": "--post",
+    "hash_branch_len": "--hash-branch-len",
+    "schema": "--schema",
+    "schema_ron": "--schema-ron",
+}
+
+
+def _table_args(command: str, table: dict[str, str], options: dict[str, Any]) -> list[str]:
+    flags = []
+    for name, value in options.items():
+        if name == "stdin":
+            continue
+
+        # Looked up before _extend_args skips unset values, so misspelled names always fail
+        flag = table.get(name)
+        if flag is None:
+            raise TypeError(f"unexpected {command}() option: {name}")
+        flags.append((flag, value))
+
+    return _extend_args(args=[command], flags=flags)
 
 
 def version(
@@ -158,66 +303,21 @@ def version(
     no_bump_context: bool | None = None,
 ) -> str:
     return _run_zerv_command(
-        args=_extend_args(
-            args=["version"],
-            flags=[
-                # Input options
-                ("-s", source),
-                ("-f", input_format),
-                ("-C", repo_path),
-                # Output options
-                ("--output-format", output_format),
-                ("--output-template", output_template),
-                ("--output-prefix", output_prefix),
-                # Schema options
-                ("--schema", schema),
-                ("--schema-ron", schema_ron),
-                # VCS override options
-                ("--tag-version", tag_version),
-                ("--distance", distance),
-                ("--dirty", dirty),
-                ("--no-dirty", no_dirty),
-                ("--clean", clean),
-                ("--bumped-branch", bumped_branch),
-                ("--bumped-commit-hash", bumped_commit_hash),
-                ("--bumped-timestamp", bumped_timestamp),
-                # Version component override options
-                ("--major", major),
-                ("--minor", minor),
-                ("--patch", patch),
-                ("--epoch", epoch),
-                ("--post", post),
-                # Version-specific override options
-                ("--dev", dev),
-                ("--pre-release-label", pre_release_label),
-                ("--pre-release-num", pre_release_num),
-                ("--custom", custom),
-                # Schema component override options
-                ("--core", core),
-                ("--extra-core", extra_core),
-                ("--build", build),
-                # Field-based bump options
-                ("--bump-major", bump_major),
-                ("--bump-minor", bump_minor),
-                ("--bump-patch", bump_patch),
-                ("--bump-post", bump_post),
-                ("--bump-dev", bump_dev),
-                ("--bump-pre-release-num", bump_pre_release_num),
-                ("--bump-epoch", bump_epoch),
-                ("--bump-pre-release-label", bump_pre_release_label),
-                # Schema-based bump options
-                ("--bump-core", bump_core),
-                ("--bump-extra-core", bump_extra_core),
-                ("--bump-build", bump_build),
-                # Context control options
-                ("--bump-context", bump_context),
-                ("--no-bump-context", no_bump_context),
-            ],
-        ),
+        args=_table_args("version", _VERSION_FLAGS, locals()),
         stdin=stdin,
     )
 
 
+def version_many(calls: list[dict[str, Any]]) -> list[str]:
+    """Run ``version`` once per dict of its keyword arguments, in order.
+
+    All calls go through one zerv process instead of one process each.
+    """
+    return _run_zerv_batch(
+        [(_table_args("version", _VERSION_FLAGS, call), call.get("stdin")) for call in calls]
+    )
+
+
 def flow(
     *,
     repo_path: str | None = None,
@@ -250,38 +350,7 @@ def flow(
     schema_ron: str | None = None,
 ) -> str:
     return _run_zerv_command(
-        args=_extend_args(
-            args=["flow"],
-            flags=[
-                ("-C", repo_path),
-                ("-s", source),
-                ("-v", verbose),
-                ("-f", input_format),
-                ("--output-format", output_format),
-                ("--output-template", output_template),
-                ("--output-prefix", output_prefix),
-                ("--pre-release-label", pre_release_label),
-                ("--pre-release-num", pre_release_num),
-                ("--post-mode", post_mode),
-                ("--branch-rules", branch_rules),
-                ("--tag-version", tag_version),
-                ("--distance", distance),
-                ("--dirty", dirty),
-                ("--no-dirty", no_dirty),
-                ("--clean", clean),
-                ("--bumped-branch", bumped_branch),
-                ("--bumped-commit-hash", bumped_commit_hash),
-                ("--bumped-timestamp", bumped_timestamp),
-                ("--major", major),
-                ("--minor", minor),
-                ("--patch", patch),
-                ("--epoch", epoch),
-                ("--post", post),
-                ("--hash-branch-len", hash_branch_len),
-                ("--schema", schema),
-                ("--schema-ron", schema_ron),
-            ],
-        ),
+        args=_table_args("flow", _FLOW_FLAGS, locals()),
         stdin=stdin,
     )
 
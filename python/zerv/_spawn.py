@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import selectors
+import signal
+
+HAS_POSIX_SPAWN = hasattr(os, "posix_spawn")
+
+
+def spawn_capture(argv: list[str]) -> tuple[int, bytes, bytes]:
+    """Run ``argv`` with ``os.posix_spawn`` and return its exit code, stdout and stderr.
+
+    A lighter path than ``subprocess.run`` for the common case of a command with no
+    input. Stdin is ``os.devnull`` rather than the caller's stdin.
+    """
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    try:
+        pid = os.posix_spawn(
+            argv[0],
+            argv,
+            os.environ,
+            file_actions=[
+                (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                (os.POSIX_SPAWN_DUP2, out_w, 1),
+                (os.POSIX_SPAWN_DUP2, err_w, 2),
+            ],
+        )
+    except OSError:
+        for fd in (out_r, err_r):
+            os.close(fd)
+        raise
+    finally:
+        os.close(out_w)
+        os.close(err_w)
+
+    stdout: list[bytes] = []
+    stderr: list[bytes] = []
+    selector = selectors.DefaultSelector()
+    selector.register(out_r, selectors.EVENT_READ, stdout)
+    selector.register(err_r, selectors.EVENT_READ, stderr)
+    try:
+        # Drain both pipes together so a chatty stderr cannot block the child
+        while selector.get_map():
+            for key, _ in selector.select():
+                chunk = os.read(key.fd, 65536)
+                if chunk:
+                    key.data.append(chunk)
+                else:
+                    selector.unregister(key.fd)
+                    os.close(key.fd)
+    except BaseException:
+        # Interrupted, e.g. by KeyboardInterrupt; do not leave the child running
+        with contextlib.suppress(ProcessLookupError):
+            os.kill(pid, signal.SIGKILL)
+        raise
+    finally:
+        for key in list(selector.get_map().values()):
+            os.close(key.fd)
+        selector.close()
+        _, status = os.waitpid(pid, 0)
+
+    return os.waitstatus_to_exitcode(status), b"".join(stdout), b"".join(stderr)
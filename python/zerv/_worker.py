@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import os
+import struct
+import subprocess
+import threading
+from io import BufferedReader, BufferedWriter
+from typing import IO, Any
+
+# Wire format shared with src/cli/serve.rs: little-endian u32 lengths, u32::MAX for None
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_NONE_LEN = 0xFFFFFFFF
+
+
+class ZervWorker:
+    """A long-lived ``zerv serve`` process answering length-prefixed requests.
+
+    Each request carries the caller's working directory. The environment is the one
+    the process started with, so ``get_worker`` replaces the worker once
+    ``os.environ`` changes.
+    """
+
+    def __init__(self, zerv_bin: str) -> None:
+        self.env = dict(os.environ)
+        self.answered = False
+        self._lock = threading.Lock()
+        self._proc = proc = subprocess.Popen(
+            [zerv_bin, "serve"],
+            # Requests run in their own cwd; idle, the worker should not hold the caller's
+            cwd=os.path.dirname(os.path.abspath(zerv_bin)),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        # Binary pipes with the default buffering
+        assert isinstance(proc.stdin, BufferedWriter)
+        assert isinstance(proc.stdout, BufferedReader)
+        self._stdin: BufferedWriter = proc.stdin
+        self._stdout: BufferedReader = proc.stdout
+
+    def run(self, args: list[str], stdin: str | None = None) -> dict[str, Any] | None:
+        """Run one command, returning None if the worker is no longer answering."""
+        request = _encode_request(args, stdin, os.getcwd())
+        with self._lock:
+            try:
+                self._stdin.write(request)
+                self._stdin.flush()
+                response = _read_response(self._stdout)
+            except (OSError, ValueError):
+                return None
+        self.answered = self.answered or response is not None
+        return response
+
+    def run_many(self, requests: list[tuple[list[str], str | None]]) -> list[dict[str, Any]] | None:
+        """Pipeline several commands, returning None if the worker stops answering.
+
+        Requests are written from a helper thread so a full stdout pipe cannot
+        block the worker while we are still writing.
+        """
+        cwd = os.getcwd()
+        payload = b"".join(_encode_request(args, stdin, cwd) for args, stdin in requests)
+        with self._lock:
+            writer = threading.Thread(target=self._write, args=(payload,), daemon=True)
+            writer.start()
+            responses: list[dict[str, Any]] = []
+            try:
+                for _ in requests:
+                    response = _read_response(self._stdout)
+                    if response is None:
+                        return None
+                    responses.append(response)
+            except (OSError, ValueError):
+                return None
+            finally:
+                writer.join()
+        self.answered = True
+        return responses
+
+    def _write(self, payload: bytes) -> None:
+        with contextlib.suppress(OSError, ValueError):
+            self._stdin.write(payload)
+            self._stdin.flush()
+
+    def abandon(self) -> None:
+        """Drop this process's ends of the pipes without stopping the worker."""
+        for stream in (self._stdin, self._stdout):
+            # Close the raw files so nothing buffered for the worker is flushed twice
+            with contextlib.suppress(OSError):
+                stream.raw.close()
+
+    @property
+    def returncode(self) -> int | None:
+        return self._proc.returncode
+
+    def close(self) -> None:
+        with self._lock:
+            with contextlib.suppress(OSError):
+                self._stdin.close()
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+                self._proc.wait()
+
+
+def _encode_request(args: list[str], stdin: str | None, cwd: str) -> bytes:
+    fields = [cwd, stdin, *args]
+    parts = [_U32.pack(len(fields))]
+    for field in fields:
+        if field is None:
+            parts.append(_U32.pack(_NONE_LEN))
+        else:
+            data = field.encode()
+            parts += (_U32.pack(len(data)), data)
+    return b"".join(parts)
+
+
+def _read_exact(stream: IO[bytes], size: int) -> bytes | None:
+    data = stream.read(size)
+    return data if len(data) == size else None
+
+
+def _read_response(stream: IO[bytes]) -> dict[str, Any] | None:
+    header = _read_exact(stream, _I32.size + _U32.size)
+    if header is None:
+        return None
+    (code,) = _I32.unpack_from(header)
+    (stdout_len,) = _U32.unpack_from(header, _I32.size)
+    stdout = _read_exact(stream, stdout_len)
+    stderr_len = _read_exact(stream, _U32.size)
+    if stdout is None or stderr_len is None:
+        return None
+    stderr = _read_exact(stream, _U32.unpack(stderr_len)[0])
+    if stderr is None:
+        return None
+    return {"code": code, "stdout": stdout.decode(), "stderr": stderr.decode(errors="replace")}
+
+
+_state_lock = threading.Lock()
+_worker: ZervWorker | None = None
+_disabled = False
+
+
+def get_worker(zerv_bin: str) -> ZervWorker | None:
+    """Return the process-wide worker, starting it on first use."""
+    global _worker, _disabled
+
+    with _state_lock:
+        if _disabled:
+            return None
+        if _worker is not None and _worker.env != os.environ:
+            # RUST_LOG, GIT_* and the PATH used to find git are read from the environment
+            _worker.close()
+            _worker = None
+        if _worker is None:
+            try:
+                _worker = ZervWorker(zerv_bin)
+            except OSError:
+                _disabled = True
+                return None
+        return _worker
+
+
+def discard_worker(worker: ZervWorker) -> None:
+    """Stop using a worker that stopped answering.
+
+    The next call starts a new worker, unless this one never answered because the
+    binary predates ``zerv serve``.
+    """
+    global _worker, _disabled
+
+    worker.close()
+    with _state_lock:
+        if _worker is worker:
+            _worker = None
+        # clap rejects the unknown `serve` subcommand with a usage error, exit code 2
+        if not worker.answered and worker.returncode == 2:
+            _disabled = True
+
+
+@atexit.register
+def _close_worker() -> None:
+    if _worker is not None:
+        _worker.close()
+
+
+def _forget_worker_after_fork() -> None:
+    # The child holds copies of the parent's pipes, which keep the worker from seeing
+    # EOF when the parent exits; it must not wait on a process it did not start
+    global _worker, _state_lock
+
+    _state_lock = threading.Lock()
+    if _worker is not None:
+        _worker.abandon()
+        _worker = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_worker_after_fork)
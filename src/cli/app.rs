@@ -14,10 +14,37 @@ use crate::cli::parser::{
     Commands,
 };
 use crate::cli::render::run_render;
+use crate::cli::serve::run_serve;
 use crate::cli::version::run_version_pipeline;
+use crate::error::ZervError;
+
+/// Where a CLI run takes its stdin content from
+enum StdinSource {
+    /// The process's own stdin
+    Process,
+    /// Content supplied by the caller, e.g. a `zerv serve` request
+    Supplied(Option<String>),
+}
 
 pub fn run_with_args<W: Write>(
     args: Vec<String>,
+    writer: W,
+) -> Result<(), Box<dyn std::error::Error>> {
+    run_cli(args, StdinSource::Process, writer)
+}
+
+/// Run the CLI with caller-supplied stdin content (used by `zerv serve`)
+pub fn run_with_stdin<W: Write>(
+    args: Vec<String>,
+    stdin_content: Option<String>,
+    writer: W,
+) -> Result<(), Box<dyn std::error::Error>> {
+    run_cli(args, StdinSource::Supplied(stdin_content), writer)
+}
+
+fn run_cli<W: Write>(
+    args: Vec<String>,
+    stdin: StdinSource,
     mut writer: W,
 ) -> Result<(), Box<dyn std::error::Error>> {
     let cli = Cli::try_parse_from(args)?;
@@ -32,8 +59,23 @@ pub fn run_with_args<W: Write>(
         return Ok(());
     }
 
+    // Serve owns stdin as a request stream, so it must not be drained upfront
+    if let Some(Commands::Serve) = cli.command {
+        return match stdin {
+            StdinSource::Process => run_serve(std::io::stdin().lock(), &mut writer),
+            // A nested serve would wait on the stdin lock its own serve loop holds
+            StdinSource::Supplied(_) => Err(ZervError::InvalidArgument(
+                "serve cannot be run from within another serve request".to_string(),
+            )
+            .into()),
+        };
+    }
+
     // Extract stdin content once at the beginning
-    let stdin_content = extract_stdin_once()?;
+    let stdin_content = match stdin {
+        StdinSource::Process => extract_stdin_once()?,
+        StdinSource::Supplied(content) => content.filter(|input| !input.trim().is_empty()),
+    };
 
     match cli.command {
         Some(Commands::Version(version_args)) => {
@@ -52,6 +94,9 @@ pub fn run_with_args<W: Write>(
             let output = run_render(*render_args)?;
             writeln!(writer, "{output}")?;
         }
+        Some(Commands::Serve) => {
+            // Handled above, before stdin is read
+        }
         None => {
             // No subcommand provided, but --llm-help was not used either
             // This will be handled by clap's default behavior
@@ -110,4 +155,33 @@ mod tests {
         // and std::process::exit, so we just ensure it compiles and can be called
         let _test_compile = run; // Ensures function exists and compiles
     }
+
+    #[test]
+    fn test_run_with_stdin_without_input() {
+        let mut output = Vec::new();
+        let args = vec![
+            "zerv".to_string(),
+            "render".to_string(),
+            "1.2.3".to_string(),
+        ];
+
+        run_with_stdin(args, None, &mut output).expect("render should succeed");
+
+        assert_eq!(String::from_utf8_lossy(&output), "1.2.3\n");
+    }
+
+    #[test]
+    fn test_run_with_stdin_reports_errors() {
+        let mut output = Vec::new();
+        let args = vec![
+            "zerv".to_string(),
+            "render".to_string(),
+            "not-a-version".to_string(),
+        ];
+
+        let result = run_with_stdin(args, Some("   ".to_string()), &mut output);
+
+        assert!(result.is_err());
+        assert!(output.is_empty());
+    }
 }
@@ -5,12 +5,14 @@ pub mod flow;
 pub mod llm_help;
 pub mod parser;
 pub mod render;
+pub mod serve;
 pub mod utils;
 pub mod version;
 
 pub use app::{
     run,
     run_with_args,
+    run_with_stdin,
 };
 pub use check::{
     CheckArgs,
@@ -28,6 +30,7 @@ pub use render::{
     RenderArgs,
     run_render,
 };
+pub use serve::run_serve;
 pub use version::{
     VersionArgs,
     run_version_pipeline,
@@ -96,6 +96,9 @@ Supports SemVer, PEP440, and other version format validation."
 Supports format conversion (SemVer ↔ PEP440), normalization, templates, and custom prefixes."
     )]
     Render(Box<RenderArgs>),
+    /// Answer length-prefixed requests on stdin (used by the Python API worker)
+    #[command(hide = true)]
+    Serve,
 }
 
 #[cfg(test)]
@@ -140,6 +143,7 @@ mod tests {
     #[case(vec!["zerv", "flow"], true)]
     #[case(vec!["zerv", "check", "1.0.0"], true)]
     #[case(vec!["zerv", "render", "1.2.3"], true)]
+    #[case(vec!["zerv", "serve"], true)]
     #[case(vec!["zerv", "invalid"], false)]
     fn test_cli_parsing(#[case] args: Vec<&str>, #[case] should_succeed: bool) {
         let result = Cli::try_parse_from(args);
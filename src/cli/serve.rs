@@ -0,0 +1,341 @@
+use std::io::{
+    self,
+    Read,
+    Write,
+};
+use std::path::PathBuf;
+
+use crate::cli::app::run_with_stdin;
+use crate::error::ZervError;
+
+/// Length marker for an absent optional field
+const NONE_LEN: u32 = u32::MAX;
+
+/// One CLI invocation sent to `zerv serve`, without the program name
+///
+/// On the wire a request is a little-endian `u32` field count followed by that many
+/// fields: `cwd`, `stdin`, then each argument. A field is a `u32` byte length and
+/// UTF-8 bytes, or [`NONE_LEN`] with no bytes when absent.
+#[derive(Debug)]
+pub struct ServeRequest {
+    pub args: Vec<String>,
+    pub stdin: Option<String>,
+    /// Working directory of the client, so relative paths resolve as they would for a child process
+    pub cwd: Option<PathBuf>,
+}
+
+/// Exit code and output streams of one invocation, as a child process would report them
+///
+/// On the wire a response is the code as a little-endian `i32`, then `stdout` and
+/// `stderr` as length-prefixed fields.
+#[derive(Debug)]
+pub struct ServeResponse {
+    pub code: i32,
+    pub stdout: String,
+    pub stderr: String,
+}
+
+impl ServeResponse {
+    fn failure(error: impl std::fmt::Display) -> Self {
+        Self {
+            code: 1,
+            stdout: String::new(),
+            stderr: format!("Error: {error}\n"),
+        }
+    }
+}
+
+/// Run one request from the client's working directory, then return to the original one
+pub fn handle_request(request: ServeRequest) -> ServeResponse {
+    let Some(cwd) = &request.cwd else {
+        return run_request(request.args, request.stdin);
+    };
+
+    let original_dir = std::env::current_dir();
+    if let Err(e) = std::env::set_current_dir(cwd) {
+        return ServeResponse::failure(ZervError::InvalidArgument(format!(
+            "Cannot change directory to '{}': {e}",
+            cwd.display()
+        )));
+    }
+
+    let response = run_request(request.args, request.stdin);
+
+    // Staying in the client's directory would keep it in use, e.g. block removing it on Windows
+    if let Ok(dir) = original_dir
+        && let Err(e) = std::env::set_current_dir(&dir)
+    {
+        tracing::warn!("Cannot restore directory '{}': {e}", dir.display());
+    }
+    response
+}
+
+fn run_request(args: Vec<String>, stdin: Option<String>) -> ServeResponse {
+    let args = std::iter::once("zerv".to_string()).chain(args).collect();
+    let mut stdout = Vec::new();
+
+    match run_with_stdin(args, stdin, &mut stdout) {
+        Ok(()) => ServeResponse {
+            code: 0,
+            stdout: String::from_utf8_lossy(&stdout).into_owned(),
+            stderr: String::new(),
+        },
+        Err(e) => match e.downcast_ref::<clap::Error>().map(clap::Error::kind) {
+            Some(clap::error::ErrorKind::DisplayHelp | clap::error::ErrorKind::DisplayVersion) => {
+                ServeResponse {
+                    code: 0,
+                    stdout: e.to_string(),
+                    stderr: String::new(),
+                }
+            }
+            _ => ServeResponse::failure(e),
+        },
+    }
+}
+
+fn read_u32<R: Read>(reader: &mut R) -> io::Result<u32> {
+    let mut buf = [0u8; 4];
+    reader.read_exact(&mut buf)?;
+    Ok(u32::from_le_bytes(buf))
+}
+
+fn read_field<R: Read>(reader: &mut R) -> io::Result<Option<Vec<u8>>> {
+    let len = read_u32(reader)?;
+    if len == NONE_LEN {
+        return Ok(None);
+    }
+
+    let mut bytes = Vec::new();
+    reader.take(u64::from(len)).read_to_end(&mut bytes)?;
+    if bytes.len() != len as usize {
+        return Err(io::ErrorKind::UnexpectedEof.into());
+    }
+    Ok(Some(bytes))
+}
+
+/// Read the fields of one request frame, or `None` once the client has closed the stream
+fn read_frame<R: Read>(reader: &mut R) -> io::Result<Option<Vec<Option<Vec<u8>>>>> {
+    let count = match read_u32(reader) {
+        Ok(count) => count,
+        Err(e) if e.kind() == io::ErrorKind::UnexpectedEof => return Ok(None),
+        Err(e) => return Err(e),
+    };
+    (0..count)
+        .map(|_| read_field(reader))
+        .collect::<io::Result<_>>()
+        .map(Some)
+}
+
+fn decode_request(fields: Vec<Option<Vec<u8>>>) -> Result<ServeRequest, ZervError> {
+    let invalid =
+        |reason: String| ZervError::InvalidArgument(format!("Invalid serve request: {reason}"));
+
+    let mut fields = fields
+        .into_iter()
+        .map(|field| field.map(String::from_utf8).transpose())
+        .collect::<Result<Vec<_>, _>>()
+        .map_err(|e| invalid(e.to_string()))?
+        .into_iter();
+
+    let (Some(cwd), Some(stdin)) = (fields.next(), fields.next()) else {
+        return Err(invalid("missing cwd or stdin field".to_string()));
+    };
+    let args = fields
+        .map(|arg| arg.ok_or_else(|| invalid("arguments cannot be absent".to_string())))
+        .collect::<Result<_, _>>()?;
+
+    Ok(ServeRequest {
+        args,
+        stdin,
+        cwd: cwd.map(PathBuf::from),
+    })
+}
+
+fn write_field<W: Write>(writer: &mut W, field: &str) -> io::Result<()> {
+    let len = u32::try_from(field.len())
+        .ok()
+        .filter(|len| *len != NONE_LEN)
+        .ok_or_else(|| io::Error::new(io::ErrorKind::InvalidData, "serve field too large"))?;
+    writer.write_all(&len.to_le_bytes())?;
+    writer.write_all(field.as_bytes())
+}
+
+fn write_response<W: Write>(writer: &mut W, response: &ServeResponse) -> io::Result<()> {
+    writer.write_all(&response.code.to_le_bytes())?;
+    write_field(writer, &response.stdout)?;
+    write_field(writer, &response.stderr)?;
+    writer.flush()
+}
+
+/// Answer length-prefixed requests until the reader is closed
+///
+/// Keeps one process alive across many invocations so clients such as the Python API
+/// pay process startup once instead of per command.
+pub fn run_serve<R: Read, W: Write>(
+    mut reader: R,
+    mut writer: W,
+) -> Result<(), Box<dyn std::error::Error>> {
+    while let Some(fields) = read_frame(&mut reader)? {
+        let response = match decode_request(fields) {
+            Ok(request) => handle_request(request),
+            Err(e) => ServeResponse::failure(e),
+        };
+        write_response(&mut writer, &response)?;
+    }
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use std::io::Cursor;
+
+    use super::*;
+
+    fn encode_field(frame: &mut Vec<u8>, field: Option<&str>) {
+        match field {
+            Some(field) => {
+                frame.extend_from_slice(&(field.len() as u32).to_le_bytes());
+                frame.extend_from_slice(field.as_bytes());
+            }
+            None => frame.extend_from_slice(&NONE_LEN.to_le_bytes()),
+        }
+    }
+
+    fn encode_request(args: &[&str]) -> Vec<u8> {
+        let mut frame = ((args.len() + 2) as u32).to_le_bytes().to_vec();
+        encode_field(&mut frame, None);
+        encode_field(&mut frame, None);
+        for arg in args {
+            encode_field(&mut frame, Some(arg));
+        }
+        frame
+    }
+
+    fn serve(input: Vec<u8>) -> Vec<(i32, String, String)> {
+        let mut output = Vec::new();
+        run_serve(Cursor::new(input), &mut output).expect("serve loop should succeed");
+
+        let mut reader = Cursor::new(output);
+        let mut responses = Vec::new();
+        while (reader.position() as usize) < reader.get_ref().len() {
+            let mut code = [0u8; 4];
+            reader
+                .read_exact(&mut code)
+                .expect("response should have a code");
+            let mut text = || {
+                let bytes = read_field(&mut reader)
+                    .expect("response field should be complete")
+                    .expect("response fields are never absent");
+                String::from_utf8(bytes).expect("response should be utf-8")
+            };
+            let stdout = text();
+            let stderr = text();
+            responses.push((i32::from_le_bytes(code), stdout, stderr));
+        }
+        responses
+    }
+
+    #[test]
+    fn test_run_serve_answers_each_request_in_order() {
+        let mut input = encode_request(&["render", "1.2.3"]);
+        input.extend(encode_request(&[
+            "render",
+            "1.2.3-alpha.1",
+            "--output-format",
+            "pep440",
+        ]));
+
+        let responses = serve(input);
+
+        assert_eq!(responses.len(), 2);
+        assert_eq!(responses[0], (0, "1.2.3\n".to_string(), String::new()));
+        assert_eq!(responses[1], (0, "1.2.3a1\n".to_string(), String::new()));
+    }
+
+    #[test]
+    fn test_run_serve_reports_command_errors() {
+        let mut input = encode_request(&["render", "not-a-version"]);
+        input.extend(encode_request(&["render", "1.0.0"]));
+
+        let responses = serve(input);
+
+        assert_eq!(responses[0].0, 1);
+        assert!(responses[0].2.starts_with("Error: "));
+        assert_eq!(responses[1].1, "1.0.0\n");
+    }
+
+    #[test]
+    fn test_run_serve_rejects_malformed_requests() {
+        let mut input = 1u32.to_le_bytes().to_vec();
+        encode_field(&mut input, None);
+        input.extend(encode_request(&["render", "1.0.0"]));
+
+        let responses = serve(input);
+
+        assert_eq!(responses[0].0, 1);
+        assert!(responses[0].2.contains("Invalid serve request"));
+        assert_eq!(responses[1].1, "1.0.0\n");
+    }
+
+    #[test]
+    fn test_run_serve_rejects_nested_serve() {
+        let mut input = encode_request(&["serve"]);
+        input.extend(encode_request(&["render", "1.0.0"]));
+
+        let responses = serve(input);
+
+        assert_eq!(responses[0].0, 1);
+        assert!(responses[0].2.contains("serve cannot be run"));
+        assert_eq!(responses[1].1, "1.0.0\n");
+    }
+
+    #[test]
+    fn test_run_serve_fails_on_truncated_frame() {
+        let mut input = encode_request(&["render", "1.2.3"]);
+        input.truncate(input.len() - 1);
+
+        let mut output = Vec::new();
+        assert!(run_serve(Cursor::new(input), &mut output).is_err());
+    }
+
+    #[test]
+    fn test_handle_request_rejects_missing_cwd() {
+        let response = handle_request(ServeRequest {
+            args: vec!["render".to_string(), "1.2.3".to_string()],
+            stdin: None,
+            cwd: Some(PathBuf::from("/nonexistent/zerv/serve/cwd")),
+        });
+
+        assert_eq!(response.code, 1);
+        assert!(response.stderr.contains("Cannot change directory"));
+    }
+
+    #[test]
+    fn test_handle_request_restores_working_directory() {
+        let original_dir = std::env::current_dir().expect("current dir should be readable");
+
+        let response = handle_request(ServeRequest {
+            args: vec!["render".to_string(), "1.2.3".to_string()],
+            stdin: None,
+            cwd: Some(std::env::temp_dir()),
+        });
+
+        assert_eq!(response.code, 0);
+        assert_eq!(
+            std::env::current_dir().expect("current dir should be readable"),
+            original_dir
+        );
+    }
+
+    #[test]
+    fn test_handle_request_passes_version_through() {
+        let response = handle_request(ServeRequest {
+            args: vec!["--version".to_string()],
+            stdin: None,
+            cwd: None,
+        });
+
+        assert_eq!(response.code, 0);
+        assert!(response.stdout.contains(env!("CARGO_PKG_VERSION")));
+    }
+}
@@ -1,3 +1,4 @@
+use std::collections::HashMap;
 use std::path::{
     Path,
     PathBuf,
@@ -134,42 +135,64 @@ impl GitVcs {
         ZervError::CommandFailed(format!("Git command failed: {stderr_str}"))
     }
 
+    /// Map each tagged commit to the tags pointing at it, in refname order
+    ///
+    /// One `for-each-ref` call replaces a `git tag --points-at` per tagged commit;
+    /// annotated tags are keyed by the commit they point to.
+    fn get_tags_by_commit(&self) -> Result<HashMap<String, Vec<String>>> {
+        let output = self.run_git_command(&[
+            "for-each-ref",
+            "--format=%(objectname) %(*objectname) %(refname:strip=2)",
+            "refs/tags",
+        ])?;
+
+        let mut tags_by_commit: HashMap<String, Vec<String>> = HashMap::new();
+        for line in output.lines() {
+            let mut fields = line.splitn(3, ' ');
+            let (Some(object), Some(peeled), Some(tag)) =
+                (fields.next(), fields.next(), fields.next())
+            else {
+                continue;
+            };
+            let commit = if peeled.is_empty() { object } else { peeled };
+            tags_by_commit
+                .entry(commit.to_string())
+                .or_default()
+                .push(tag.to_string());
+        }
+        Ok(tags_by_commit)
+    }
+
     /// Get all commits from HEAD in topological order (only commits with tags)
-    fn get_commits_in_topo_order(&self) -> Result<Vec<String>> {
+    fn get_commits_in_topo_order(
+        &self,
+        tags_by_commit: &HashMap<String, Vec<String>>,
+    ) -> Result<Vec<String>> {
         let commits_output = self.run_git_command(&["rev-list", "--topo-order", "HEAD"])?;
-        let commits_output_only_with_tags =
-            self.run_git_command(&["log", "--tags", "--no-walk", "--format=%H"])?;
-
-        let tagged_commits: std::collections::HashSet<String> = commits_output_only_with_tags
-            .lines()
-            .map(|line| line.trim().to_string())
-            .filter(|hash| !hash.is_empty())
-            .collect();
 
         Ok(commits_output
             .lines()
-            .map(|line| line.trim().to_string())
-            .filter(|hash| !hash.is_empty() && tagged_commits.contains(hash))
+            .map(str::trim)
+            .filter(|hash| tags_by_commit.contains_key(*hash))
+            .map(str::to_string)
             .collect())
     }
 
     /// Get latest version tag using enhanced algorithm
     fn get_latest_tag(&self, format: &str) -> Result<Option<String>> {
-        // Get all commits from HEAD in topological order
-        let commits = self.get_commits_in_topo_order()?;
-
-        // Process each commit in topological order
-        for commit_hash in commits {
-            // Get all tags pointing to this commit (reusing existing function)
-            let tags = self.get_all_tags_from_commit_hash(&commit_hash);
+        let tags_by_commit = self.get_tags_by_commit()?;
+        if tags_by_commit.is_empty() {
+            return Ok(None);
+        }
 
-            // If no tags, continue to next commit
-            if tags.is_empty() {
+        // Process each tagged commit in topological order
+        for commit_hash in self.get_commits_in_topo_order(&tags_by_commit)? {
+            let Some(tags) = tags_by_commit.get(&commit_hash) else {
                 continue;
-            }
+            };
 
             // Filter tags by format
-            let valid_tags = GitUtils::filter_only_valid_tags(&tags, format);
+            let valid_tags = GitUtils::filter_only_valid_tags(tags, format);
 
             // If no valid tags, continue to next commit
             if valid_tags.is_empty() {
@@ -186,18 +209,6 @@ impl GitVcs {
         Ok(None)
     }
 
-    /// Get all tags pointing to a commit hash
-    fn get_all_tags_from_commit_hash(&self, commit_hash: &str) -> Vec<String> {
-        match self.run_git_command(&["tag", "--points-at", commit_hash]) {
-            Ok(tags_output) => tags_output
-                .lines()
-                .map(|line| line.trim().to_string())
-                .filter(|tag| !tag.is_empty())
-                .collect(),
-            Err(_) => Vec::new(), // Return empty vector if no tags found
-        }
-    }
-
     fn calculate_distance(&self, tag: &str) -> Result<u32> {
         let output = self.run_git_command(&["rev-list", "--count", &format!("{tag}..HEAD")])?;
         output
@@ -1000,6 +1011,28 @@ mod tests {
         Ok(())
     }
 
+    #[test]
+    fn test_get_tags_by_commit_peels_annotated_tags() -> crate::error::Result<()> {
+        if !should_run_docker_tests() {
+            return Ok(());
+        }
+
+        let fixture = GitRepoFixture::tagged_annotated("v1.0.0", "Annotated release")
+            .expect("Failed to create fixture")
+            .create_tag("v1.0.1");
+
+        let git_vcs = GitVcs::new(fixture.path())?;
+        let head = git_vcs.get_commit_hash()?;
+        let tags_by_commit = git_vcs.get_tags_by_commit()?;
+
+        assert_eq!(tags_by_commit.len(), 1);
+        assert_eq!(
+            tags_by_commit.get(&head),
+            Some(&vec!["v1.0.0".to_string(), "v1.0.1".to_string()])
+        );
+        Ok(())
+    }
+
     // Test with mixed annotated and lightweight tags
     #[test]
     fn test_get_latest_tag_mixed_tag_types() -> crate::error::Result<()> {
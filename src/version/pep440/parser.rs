@@ -17,7 +17,7 @@ static PEP440_REGEX: LazyLock<Regex> = LazyLock::new(|| {
             (?P<release>[0-9]+(?:\.[0-9]+)*)                  # release segment
             (?P<pre>                                          # pre-release
                 [-_\.]?
-                (?P<pre_l>alpha|a|beta|b|preview|pre|c|rc)
+                (?P<pre_l>a(?:lpha)?|b(?:eta)?|pre(?:view)?|rc|c)
                 [-_\.]?
                 (?P<pre_n>[0-9]+)?
             )?
@@ -26,7 +26,7 @@ static PEP440_REGEX: LazyLock<Regex> = LazyLock::new(|| {
                 |
                 (?:
                     [-_\.]?
-                    (?P<post_l>post|rev|r)
+                    (?P<post_l>post|r(?:ev)?)
                     [-_\.]?
                     (?P<post_n2>[0-9]+)?
                 )
@@ -44,16 +44,57 @@ static PEP440_REGEX: LazyLock<Regex> = LazyLock::new(|| {
     .unwrap()
 });
 
+/// Parse release-only versions (`v?N(.N)*`) in a single pass without running the
+/// full PEP440 regex. Segments that overflow u32 become 0, matching the regex path.
+fn parse_release_only(s: &str) -> Option<Vec<u32>> {
+    let digits = s.strip_prefix(['v', 'V']).unwrap_or(s);
+    let mut release = Vec::with_capacity(3);
+    let mut segment: Option<u32> = Some(0);
+    let mut segment_len = 0;
+
+    for byte in digits.bytes() {
+        match byte {
+            b'0'..=b'9' => {
+                segment = segment
+                    .and_then(|n| n.checked_mul(10))
+                    .and_then(|n| n.checked_add(u32::from(byte - b'0')));
+                segment_len += 1;
+            }
+            b'.' if segment_len > 0 => {
+                release.push(segment.unwrap_or(0));
+                segment = Some(0);
+                segment_len = 0;
+            }
+            _ => return None,
+        }
+    }
+
+    if segment_len == 0 {
+        return None;
+    }
+    release.push(segment.unwrap_or(0));
+    Some(release)
+}
+
+/// Map a `pre_l` capture straight to its label; PEP440_REGEX only admits
+/// alpha/a, beta/b and rc/c/pre/preview, so the first letter is enough
+fn pre_release_label_from_capture(pre_l: &str) -> PreReleaseLabel {
+    match pre_l.as_bytes().first() {
+        Some(b'a' | b'A') => PreReleaseLabel::Alpha,
+        Some(b'b' | b'B') => PreReleaseLabel::Beta,
+        _ => PreReleaseLabel::Rc,
+    }
+}
+
 pub fn parse_local_segments(local: &str) -> Vec<LocalSegment> {
-    // Normalize separators: replace - and _ with .
-    let normalized = local.replace(['-', '_'], ".");
-    normalized
-        .split('.')
+    // `-`, `_` and `.` are equivalent separators in PEP440 local versions
+    local
+        .split(['.', '-', '_'])
         .map(|part| {
-            if !part.is_empty() && part.chars().all(|c| c.is_ascii_digit()) {
+            if !part.is_empty() && part.bytes().all(|b| b.is_ascii_digit()) {
                 LocalSegment::new_uint(part.parse().unwrap_or(0))
             } else {
-                LocalSegment::try_new_str(part.to_string()).unwrap()
+                LocalSegment::try_new_str(part).unwrap()
             }
         })
         .collect()
@@ -63,6 +104,10 @@ impl FromStr for PEP440 {
     type Err = ZervError;
 
     fn from_str(s: &str) -> Result<Self, Self::Err> {
+        if let Some(release) = parse_release_only(s) {
+            return Ok(PEP440::new(release).normalize());
+        }
+
         let captures = PEP440_REGEX
             .captures(s)
             .ok_or_else(|| ZervError::InvalidVersion(format!("Invalid PEP440 version: {s}")))?;
@@ -85,7 +130,7 @@ impl FromStr for PEP440 {
         }
 
         if let Some(pre_l) = captures.name("pre_l") {
-            let label = PreReleaseLabel::from_str_or_alpha(pre_l.as_str());
+            let label = pre_release_label_from_capture(pre_l.as_str());
             let number = captures.name("pre_n").and_then(|m| m.as_str().parse().ok());
             version = version.with_pre_release(label, number);
         }
@@ -136,6 +181,35 @@ mod tests {
         assert_eq!(parsed.local, None);
     }
 
+    #[rstest]
+    #[case("1", vec![1])]
+    #[case("v1.2.3", vec![1, 2, 3])]
+    #[case("V2.0", vec![2, 0])]
+    #[case("1.2.3.4.5", vec![1, 2, 3, 4, 5])]
+    #[case("1.01.0", vec![1, 1, 0])]
+    #[case("4294967295.0", vec![4294967295, 0])]
+    #[case("4294967296.1", vec![0, 1])]
+    fn test_parse_release_only_fast_path(#[case] input: &str, #[case] release: Vec<u32>) {
+        assert_eq!(parse_release_only(input), Some(release.clone()));
+
+        let parsed: PEP440 = input.parse().unwrap();
+        assert_eq!(parsed, PEP440::new(release));
+    }
+
+    #[rstest]
+    #[case("")]
+    #[case("v")]
+    #[case("1.")]
+    #[case(".1")]
+    #[case("1..2")]
+    #[case("1.2.3a1")]
+    #[case("1!1.2.3")]
+    #[case("1.2.3+local")]
+    #[case("1.2.3\n")]
+    fn test_parse_release_only_falls_back(#[case] input: &str) {
+        assert_eq!(parse_release_only(input), None);
+    }
+
     #[rstest]
     #[case("5!1.2.3", 5, vec![1, 2, 3])]
     #[case("42!2025.12.31", 42, vec![2025, 12, 31])]
@@ -551,6 +625,16 @@ mod tests {
 
         let segments = parse_local_segments("007.008");
         assert_eq!(segments, vec![LocalSegment::UInt(7), LocalSegment::UInt(8)]);
+
+        let segments = parse_local_segments("ubuntu-20_04");
+        assert_eq!(
+            segments,
+            vec![
+                LocalSegment::Str("ubuntu".to_string()),
+                LocalSegment::UInt(20),
+                LocalSegment::UInt(4)
+            ]
+        );
     }
 
     #[rstest]
@@ -35,12 +35,22 @@ impl PreReleaseLabel {
     /// Flexible parsing with alternative forms
     /// This replaces the existing normalize_pre_release_label function
     pub fn try_from_str(label: &str) -> Option<Self> {
-        match label.to_lowercase().as_str() {
-            pre_release_labels::ALPHA | "a" => Some(PreReleaseLabel::Alpha),
-            pre_release_labels::BETA | "b" => Some(PreReleaseLabel::Beta),
-            pre_release_labels::RC | "c" | "preview" | "pre" => Some(PreReleaseLabel::Rc),
-            _ => None,
-        }
+        const ALIASES: [(&str, PreReleaseLabel); 8] = [
+            (pre_release_labels::ALPHA, PreReleaseLabel::Alpha),
+            ("a", PreReleaseLabel::Alpha),
+            (pre_release_labels::BETA, PreReleaseLabel::Beta),
+            ("b", PreReleaseLabel::Beta),
+            (pre_release_labels::RC, PreReleaseLabel::Rc),
+            ("c", PreReleaseLabel::Rc),
+            ("preview", PreReleaseLabel::Rc),
+            ("pre", PreReleaseLabel::Rc),
+        ];
+
+        // Case-insensitive compare in place instead of allocating a lowercased copy
+        ALIASES
+            .iter()
+            .find(|(alias, _)| alias.eq_ignore_ascii_case(label))
+            .map(|(_, pre_release_label)| *pre_release_label)
     }
 
     /// Flexible parsing with alpha fallback (for PEP440 parser compatibility)
@@ -1,11 +1,43 @@
 from __future__ import annotations
 
+import os
+import subprocess
+from pathlib import Path
+
 import pytest
+from zerv._find_zerv import find_zerv_bin
 
 from tests.python.utils import symlink_zerv_to_venv_bin as _symlink_zerv_to_venv_bin
 
 
 @pytest.fixture(scope="session", autouse=True)
 def symlink_zerv_to_venv_bin():
-    _symlink_zerv_to_venv_bin()
+    # Set ZERV_SKIP_SYMLINK to true/1 when zerv is already installed where find_zerv_bin looks
+    if os.environ.get("ZERV_SKIP_SYMLINK", "").lower() not in ("true", "1"):
+        _symlink_zerv_to_venv_bin()
     yield
+
+
+@pytest.fixture(scope="session")
+def zerv_bin_path() -> str:
+    return find_zerv_bin()
+
+
+@pytest.fixture(scope="session")
+def git_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A minimal tagged repository, so git-sourced tests do not depend on this checkout."""
+    repo = tmp_path_factory.mktemp("git_repo")
+    git = ["git", "-c", "user.name=zerv", "-c", "user.email=zerv@example.com"]
+    for args in (
+        ["init", "-q"],
+        ["commit", "-q", "--allow-empty", "--no-gpg-sign", "-m", "init"],
+        ["tag", "v1.0.0"],
+    ):
+        subprocess.run([*git, *args], cwd=repo, check=True)
+    return repo
+
+
+@pytest.fixture
+def in_git_repo(git_repo: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(git_repo)
+    return git_repo
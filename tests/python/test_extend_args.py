@@ -15,7 +15,6 @@ def test_extend_args_basic():
     )
     assert result == ["base", "--foo", "value", "--baz"]
 
-
-def test_extend_args_returns_list_for_chaining():
-    result = _extend_args(["cmd"], [("--opt", "val")])
-    assert result == ["cmd", "--opt", "val"]
+    args = ["cmd"]
+    assert _extend_args(args, [("--opt", "val")]) is args
+    assert args == ["cmd", "--opt", "val"]
@@ -3,6 +3,8 @@ from __future__ import annotations
 import pytest
 from zerv import flow
 
+pytestmark = pytest.mark.usefixtures("in_git_repo")
+
 
 @pytest.mark.parametrize(
     "kwargs",
@@ -22,31 +22,19 @@ from zerv import render
         # Output template
         ({"version": "1.2.3", "output_template": "v{{major}}"}, "v1"),
         ({"version": "1.2.3", "output_template": "{{major}}.{{minor}}"}, "1.2"),
-    ],
-)
-def test_render_all_args(kwargs, expected):
-    """Test all render() arguments work without error."""
-    result = render(**kwargs)
-    assert result == expected
-
-
-@pytest.mark.parametrize(
-    "version,output_format,expected",
-    [
         # SemVer to PEP440
-        ("1.2.3", "pep440", "1.2.3"),
-        ("1.2.3-alpha.1", "pep440", "1.2.3a1"),
-        ("1.2.3-beta.2", "pep440", "1.2.3b2"),
-        ("1.2.3-rc.3", "pep440", "1.2.3rc3"),
-        ("1.2.3-post.1", "pep440", "1.2.3.post1"),
+        ({"version": "1.2.3-alpha.1", "output_format": "pep440"}, "1.2.3a1"),
+        ({"version": "1.2.3-beta.2", "output_format": "pep440"}, "1.2.3b2"),
+        ({"version": "1.2.3-rc.3", "output_format": "pep440"}, "1.2.3rc3"),
+        ({"version": "1.2.3-post.1", "output_format": "pep440"}, "1.2.3.post1"),
         # PEP440 to SemVer
-        ("1.2.3a1", "semver", "1.2.3-alpha.1"),
-        ("1.2.3b2", "semver", "1.2.3-beta.2"),
-        ("1.2.3rc3", "semver", "1.2.3-rc.3"),
-        ("1.2.3.post1", "semver", "1.2.3-post.1"),
+        ({"version": "1.2.3a1", "output_format": "semver"}, "1.2.3-alpha.1"),
+        ({"version": "1.2.3b2", "output_format": "semver"}, "1.2.3-beta.2"),
+        ({"version": "1.2.3rc3", "output_format": "semver"}, "1.2.3-rc.3"),
+        ({"version": "1.2.3.post1", "output_format": "semver"}, "1.2.3-post.1"),
     ],
 )
-def test_render_format_conversion(version, output_format, expected):
-    """Test format conversion between SemVer and PEP440."""
-    result = render(version, output_format=output_format)
+def test_render_all_args(kwargs, expected):
+    """Test render() arguments and SemVer/PEP440 conversion."""
+    result = render(**kwargs)
     assert result == expected
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import io
+import os
+import shutil
+
+import pytest
+import zerv
+from zerv import _run_zerv_command, _worker, _zerv_bin, find_zerv_bin
+from zerv._spawn import HAS_POSIX_SPAWN, spawn_capture
+from zerv._worker import _encode_request, _read_response, get_worker
+
+
+class _DeadWorker:
+    def run(self, *_args: object) -> None:
+        return None
+
+
+def test_run_zerv_command_runs_binary():
+    assert _run_zerv_command(["render", "1.2.3"]) == "1.2.3"
+
+
+def test_run_zerv_command_resolves_binary_once(monkeypatch):
+    lookups: list[str] = []
+
+    def counting_find_zerv_bin() -> str:
+        lookups.append("lookup")
+        return find_zerv_bin()
+
+    monkeypatch.setattr(zerv, "find_zerv_bin", counting_find_zerv_bin)
+    monkeypatch.setattr(zerv, "get_worker", lambda _zerv_bin: None)
+    _zerv_bin.cache_clear()
+    try:
+        assert _run_zerv_command(["render", "1.2.3"]) == "1.2.3"
+        assert _run_zerv_command(["render", "2.0.0"]) == "2.0.0"
+    finally:
+        _zerv_bin.cache_clear()
+
+    assert lookups == ["lookup"]
+
+
+def test_run_zerv_command_reuses_worker():
+    assert _run_zerv_command(["render", "1.2.3"]) == "1.2.3"
+    worker = get_worker(find_zerv_bin())
+    assert worker is not None
+    assert _run_zerv_command(["render", "2.0.0"]) == "2.0.0"
+    assert get_worker(find_zerv_bin()) is worker
+
+
+def test_run_zerv_command_raises_worker_errors():
+    with pytest.raises(RuntimeError, match="zerv command failed"):
+        _run_zerv_command(["render", "not-a-version"])
+
+
+def test_run_zerv_command_falls_back_when_worker_dies(monkeypatch):
+    dead = _DeadWorker()
+    discarded: list[_DeadWorker] = []
+    monkeypatch.setattr(zerv, "get_worker", lambda _zerv_bin: dead)
+    monkeypatch.setattr(zerv, "discard_worker", discarded.append)
+
+    assert _run_zerv_command(["render", "1.2.3"]) == "1.2.3"
+    assert discarded == [dead]
+
+
+def test_run_zerv_command_restarts_worker_after_it_dies():
+    assert _run_zerv_command(["render", "1.2.3"]) == "1.2.3"
+    worker = get_worker(find_zerv_bin())
+    assert worker is not None
+    worker._proc.kill()
+    worker._proc.wait()
+
+    assert _run_zerv_command(["render", "2.0.0"]) == "2.0.0"
+    restarted = get_worker(find_zerv_bin())
+    assert restarted is not None
+    assert restarted is not worker
+
+
+@pytest.mark.skipif(not HAS_POSIX_SPAWN, reason="os.posix_spawn is not available")
+def test_spawn_capture():
+    assert spawn_capture([find_zerv_bin(), "render", "1.2.3"]) == (0, b"1.2.3\n", b"")
+
+    returncode, stdout, stderr = spawn_capture([find_zerv_bin(), "render", "not-a-version"])
+    assert returncode != 0
+    assert stdout == b""
+    assert stderr.startswith(b"Error")
+
+
+@pytest.mark.skipif(not HAS_POSIX_SPAWN, reason="os.posix_spawn is not available")
+def test_spawn_capture_does_not_read_caller_stdin():
+    cat = shutil.which("cat")
+    if cat is None:
+        pytest.skip("cat is not available")
+
+    assert spawn_capture([cat]) == (0, b"", b"")
+
+
+def test_worker_frames():
+    assert _encode_request(["render"], None, "/") == b"".join(
+        [
+            b"\x03\x00\x00\x00",
+            b"\x01\x00\x00\x00/",
+            b"\xff\xff\xff\xff",
+            b"\x06\x00\x00\x00render",
+        ]
+    )
+
+    frame = b"".join([b"\x01\x00\x00\x00", b"\x00\x00\x00\x00", b"\x04\x00\x00\x00oops"])
+    assert _read_response(io.BytesIO(frame)) == {"code": 1, "stdout": "", "stderr": "oops"}
+    assert _read_response(io.BytesIO(frame[:-1])) is None
+
+
+def test_get_worker_restarts_when_environment_changes(monkeypatch):
+    worker = get_worker(find_zerv_bin())
+    monkeypatch.setenv("ZERV_FORCE_RUST_LOG_OFF", "true")
+
+    restarted = get_worker(find_zerv_bin())
+    assert restarted is not None
+    assert restarted is not worker
+    assert get_worker(find_zerv_bin()) is restarted
+    assert _run_zerv_command(["render", "1.2.3"]) == "1.2.3"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+def test_forked_child_forgets_worker():
+    assert get_worker(find_zerv_bin()) is not None
+
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0 if _worker._worker is None else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pytest
 from zerv import flow, version
 
 SAMPLE_ZERV_INPUT = """(
@@ -72,6 +73,7 @@ def test_version_with_stdin_and_schema():
     assert result
 
 
+@pytest.mark.usefixtures("in_git_repo")
 def test_version_pipe_between_commands():
     # First call: get version in zerv format
     zerv_output = version(tag_version="v1.2.3", clean=True, output_format="zerv")
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import inspect
+
+import pytest
+from zerv import _FLOW_FLAGS, _VERSION_FLAGS, _table_args, flow, version
+
+_TABLE = {"source": "-s", "dirty": "--dirty", "major": "--major"}
+
+
+def test_table_args_basic():
+    result = _table_args(
+        "version",
+        _TABLE,
+        {
+            "source": "git",
+            "dirty": True,  # flag only
+            "major": None,  # skipped
+        },
+    )
+    assert result == ["version", "-s", "git", "--dirty"]
+
+
+def test_table_args_skips_false_and_stdin():
+    assert _table_args("version", _TABLE, {"dirty": False, "stdin": "1.0.0"}) == ["version"]
+
+
+def test_table_args_converts_values_to_str():
+    assert _table_args("version", _TABLE, {"major": 2}) == ["version", "--major", "2"]
+
+
+@pytest.mark.parametrize("value", [True, False, None])
+def test_table_args_rejects_unknown_options(value):
+    with pytest.raises(TypeError, match="unexpected version\\(\\) option: drity"):
+        _table_args("version", _TABLE, {"drity": value})
+
+
+@pytest.mark.parametrize(("func", "table"), [(version, _VERSION_FLAGS), (flow, _FLOW_FLAGS)])
+def test_flag_table_covers_signature(func, table):
+    params = set(inspect.signature(func).parameters) - {"stdin"}
+    assert params == set(table)
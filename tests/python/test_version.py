@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
-from zerv import version
+from zerv import version, version_many
+
+pytestmark = pytest.mark.usefixtures("in_git_repo")
 
 
 @pytest.mark.parametrize(
@@ -61,3 +65,17 @@ from zerv import version
 def test_version_all_args(kwargs):
     result = version(**kwargs)
     assert result
+
+
+def test_version_many_matches_version():
+    calls: list[dict[str, Any]] = [
+        {},
+        {"tag_version": "v1.0.0", "distance": 3},
+        {"output_format": "pep440"},
+    ]
+    assert version_many(calls) == [version(**call) for call in calls]
+
+
+def test_version_many_rejects_unknown_options():
+    with pytest.raises(TypeError, match="tag_verison"):
+        version_many([{"tag_verison": None}])
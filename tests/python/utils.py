@@ -1,26 +1,30 @@
 from __future__ import annotations
 
+import contextlib
+import os
 import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+_BINARY_NAME = "zerv.exe" if sys.platform == "win32" else "zerv"
+_VENV_BIN = Path(sys.prefix) / ("Scripts" if sys.platform == "win32" else "bin")
 
+
+@lru_cache(maxsize=1)
 def find_zerv_bin_from_target() -> Path:
     """Find the zerv binary in target/release or target/debug."""
-    project_root = Path(__file__).parent.parent.parent
-
-    binary_name = "zerv.exe" if sys.platform == "win32" else "zerv"
-
     for path in [
-        project_root / "target" / "release" / binary_name,
-        project_root / "target" / "debug" / binary_name,
+        _PROJECT_ROOT / "target" / "release" / _BINARY_NAME,
+        _PROJECT_ROOT / "target" / "debug" / _BINARY_NAME,
     ]:
-        if path.exists() and path.is_file():
+        if path.is_file():
             return path
 
     raise FileNotFoundError(
-        f"Could not find zerv binary (searched for '{binary_name}'). Searched in: "
-        f"{project_root / 'target' / 'release'}, {project_root / 'target' / 'debug'}"
+        f"Could not find zerv binary (searched for '{_BINARY_NAME}'). Searched in: "
+        f"{_PROJECT_ROOT / 'target' / 'release'}, {_PROJECT_ROOT / 'target' / 'debug'}"
     )
 
 
@@ -32,6 +36,9 @@ def symlink_zerv_to_venv_bin(zerv_bin: Path | None = None) -> Path:
     This creates a symlink from the actual binary location (target/release or target/debug)
     to the venv's bin directory.
 
+    The link is built under a per-process temporary name and moved into place with
+    `os.replace`, so concurrent pytest-xdist workers never see it missing or collide.
+
     Args:
         zerv_bin: Path to zerv binary. If None, will auto-detect.
 
@@ -41,20 +48,21 @@ def symlink_zerv_to_venv_bin(zerv_bin: Path | None = None) -> Path:
     if zerv_bin is None:
         zerv_bin = find_zerv_bin_from_target()
 
-    if sys.platform == "win32":
-        venv_bin = Path(sys.prefix) / "Scripts"
-    else:
-        venv_bin = Path(sys.prefix) / "bin"
+    symlink_path = _VENV_BIN / _BINARY_NAME
 
-    symlink_name = "zerv.exe" if sys.platform == "win32" else "zerv"
-    symlink_path = venv_bin / symlink_name
+    # Repeat runs and other xdist workers find the link already in place
+    with contextlib.suppress(OSError):
+        if os.readlink(symlink_path) == os.fspath(zerv_bin):
+            return symlink_path
 
-    if symlink_path.exists() or symlink_path.is_symlink():
-        symlink_path.unlink()
+    tmp_path = _VENV_BIN / f".{_BINARY_NAME}.{os.getpid()}.tmp"
+    with contextlib.suppress(FileNotFoundError):
+        tmp_path.unlink()
 
     try:
-        symlink_path.symlink_to(zerv_bin)
+        os.symlink(zerv_bin, tmp_path)
     except OSError:
-        shutil.copy2(zerv_bin, symlink_path)
+        shutil.copy2(zerv_bin, tmp_path)
+    os.replace(tmp_path, symlink_path)
 
     return symlink_path